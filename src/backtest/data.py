@@ -33,8 +33,11 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import FMP_API_KEY, LOOKBACK_DAYS
 from data.earnings import EarningsSurprise, _beat_pct
@@ -42,6 +45,40 @@ from data.sector import SECTOR_ETF_MAP, FALLBACK_ETF
 
 logger = logging.getLogger(__name__)
 
+# Optional accelerator for parameter sweeps: get_atr_as_of runs once per
+# open position per simulated day, so sweeps hit the Wilder recurrence
+# millions of times. Numba is not a hard dependency — without it the pure
+# Python loop below is used and produces identical results.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+def _wilder_atr(tr: np.ndarray, alpha: float) -> float:
+    atr = tr[0]
+    for i in range(1, tr.shape[0]):
+        atr = (1.0 - alpha) * atr + alpha * tr[i]
+    return atr
+
+
+if _njit is not None:
+    _wilder_atr = _njit(cache=True)(_wilder_atr)
+
+# Shared session for FMP fetches: cache warm-up makes thousands of small
+# requests, and keep-alive amortizes the TCP/TLS handshake across them.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+_SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+
 CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "backtest_cache"
 
 
@@ -97,7 +134,7 @@ def get_ohlcv_range(ticker: str, start: str, end: str) -> pd.DataFrame:
         f"https://financialmodelingprep.com/api/v3/historical-price-full/{ticker}"
         f"?from={fetch_start}&to={fetch_end}&apikey={FMP_API_KEY}"
     )
-    resp = requests.get(url, timeout=30)
+    resp = _SESSION.get(url, timeout=30)
     resp.raise_for_status()
     payload = resp.json()
     bars = payload.get("historical", []) if isinstance(payload, dict) else []
@@ -134,12 +171,13 @@ def get_atr_as_of(df: pd.DataFrame, date: str, period: int = 14) -> float:
     sub = df[df.index.strftime("%Y-%m-%d") <= date].tail(period + 10)
     if len(sub) < 2:
         raise ValueError(f"Not enough data to compute ATR as of {date}")
-    high, low, close = sub["High"], sub["Low"], sub["Close"]
-    prev_close = close.shift(1)
-    tr = pd.concat(
-        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
-    ).max(axis=1)
-    return float(tr.ewm(alpha=1 / period, adjust=False).mean().iloc[-1])
+    high = sub["High"].to_numpy(dtype=float)
+    low = sub["Low"].to_numpy(dtype=float)
+    close = sub["Close"].to_numpy(dtype=float)
+    hl = high - low
+    tr = hl.copy()
+    tr[1:] = np.fmax(hl[1:], np.fmax(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])))
+    return float(_wilder_atr(tr, 1.0 / period))
 
 
 def get_prior_runup_as_of(df: pd.DataFrame, date: str, days: int = LOOKBACK_DAYS) -> float:
@@ -189,7 +227,7 @@ def get_historical_earnings_calendar(date: str) -> list[dict]:
             return json.load(f)
 
     url = "https://financialmodelingprep.com/api/v3/earning_calendar"
-    resp = requests.get(
+    resp = _SESSION.get(
         url, params={"from": date, "to": date, "apikey": FMP_API_KEY}, timeout=15
     )
     resp.raise_for_status()
@@ -217,7 +255,7 @@ def get_ah_entry_price_fmp(ticker: str, date: str) -> float:
             return json.load(f)["price"]
 
     url = f"https://financialmodelingprep.com/api/v3/historical-chart/5min/{ticker}"
-    resp = requests.get(
+    resp = _SESSION.get(
         url, params={"from": date, "to": date, "extended": "true", "apikey": FMP_API_KEY}, timeout=15
     )
     resp.raise_for_status()
@@ -248,7 +286,7 @@ def get_historical_surprise(ticker: str, date: str) -> EarningsSurprise:
             r = json.load(f)
     else:
         url = "https://financialmodelingprep.com/stable/earnings"
-        resp = requests.get(
+        resp = _SESSION.get(
             url,
             params={"symbol": ticker.upper(), "apikey": FMP_API_KEY, "limit": 20},
             timeout=10,
@@ -311,7 +349,7 @@ def _load_stock_list() -> dict[str, dict]:
             records = json.load(f)
     else:
         url = f"https://financialmodelingprep.com/api/v3/stock/list?apikey={FMP_API_KEY}"
-        resp = requests.get(url, timeout=60)
+        resp = _SESSION.get(url, timeout=60)
         resp.raise_for_status()
         records = resp.json()
         with cache_path.open("w") as f:
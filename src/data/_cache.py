@@ -0,0 +1,50 @@
+"""
+File-backed TTL cache for small JSON API responses.
+
+    FileCache(directory, default_ttl)   one file per entry under directory
+    cache.get(endpoint, params)         -> cached data, or None if missing/expired
+    cache.set(endpoint, params, data, ttl=None)
+
+Entries are stored as {"ts": ..., "ttl": ..., "data": ...} keyed by
+md5(endpoint + sorted params), so each entry expires independently.
+Corrupt or unreadable entries are treated as cache misses.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+
+
+class FileCache:
+    def __init__(self, directory: str = ".cache/fmp", default_ttl: float = 7 * 86400):
+        self.directory = Path(directory)
+        self.default_ttl = default_ttl
+
+    def _path(self, endpoint: str, params: dict) -> Path:
+        key = endpoint + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return self.directory / (hashlib.md5(key.encode()).hexdigest() + ".json")
+
+    def get(self, endpoint: str, params: dict):
+        """Return the cached payload for endpoint+params, or None if missing/expired."""
+        path = self._path(endpoint, params)
+        if not path.exists():
+            return None
+        try:
+            with path.open("r") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - entry.get("ts", 0) >= entry.get("ttl", 0):
+            return None
+        return entry.get("data")
+
+    def set(self, endpoint: str, params: dict, data, ttl: float | None = None) -> None:
+        """Store a payload for endpoint+params with the given TTL (seconds)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "ts": time.time(),
+            "ttl": self.default_ttl if ttl is None else ttl,
+            "data": data,
+        }
+        with self._path(endpoint, params).open("w") as f:
+            json.dump(entry, f)
@@ -3,25 +3,107 @@ Earnings data from the Financial Modeling Prep (FMP) API.
 
     EarningsSurprise                          dataclass with eps/rev beat pcts and guidance flag
     EarningsCalendarEntry                     dataclass with ticker, date, timing, estimates
-    get_earnings_surprise(ticker, date=None)  -> EarningsSurprise
-    get_earnings_calendar(date, timing='amc') -> list[str]   timing: 'amc' | 'bmo'
-    get_earnings_calendar_details(date)       -> list[EarningsCalendarEntry]
+    get_earnings_surprise(ticker, date=None)          -> EarningsSurprise
+    get_earnings_calendar(start, end=None, timing='amc') -> list[str]   timing: 'amc' | 'bmo'
+    get_earnings_calendar_details(start, end=None)    -> list[EarningsCalendarEntry]
 
 Requires env var: FMP_API_KEY
 """
+import atexit
 import logging
+import threading
+import time
 from dataclasses import dataclass
+from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import FMP_API_KEY
+from data._cache import FileCache
 
 logger = logging.getLogger(__name__)
 
+# Optional accelerator: orjson decodes the large calendar payloads several
+# times faster than stdlib json. Not a hard dependency.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 BASE_STABLE = "https://financialmodelingprep.com/stable"
 
 
-@dataclass
+def _parse_json(resp):
+    """Decode a response body, preferring orjson when installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(resp.content)
+        except (TypeError, ValueError):
+            pass  # non-bytes content (e.g. mocked responses in tests)
+    return resp.json()
+
+
+# Disk cache: reported surprises and past calendar entries are immutable, so
+# repeat queries for the same (ticker, date) become local JSON loads.
+_CACHE = FileCache(directory=".cache/fmp")
+_TTL_IMMUTABLE = 90 * 86400   # reported quarters / past calendar dates
+_TTL_RECENT = 86400           # "most recent report" queries (next quarter lands eventually)
+_TTL_CALENDAR = 7 * 86400     # calendar ranges that include today or the future
+
+# Shared session: HTTP keep-alive amortizes the TCP/TLS handshake across the
+# many small FMP calls a scan cycle makes, and retries smooth over transient
+# 429/5xx responses.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+_SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+atexit.register(_SESSION.close)
+
+# Circuit breaker: the adapter's Retry handles transient errors, but when FMP
+# is properly down a scan of N tickers would still burn N * (retries * timeout)
+# seconds. After enough consecutive failures, fail fast for a cooldown instead.
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 60.0
+_breaker_lock = threading.Lock()
+_breaker_failures = 0
+_breaker_open_until = 0.0
+
+
+def _fmp_get(url: str, params: dict):
+    """GET via the shared session with status check and circuit breaking."""
+    global _breaker_failures, _breaker_open_until
+    with _breaker_lock:
+        if time.time() < _breaker_open_until:
+            raise ConnectionError("FMP circuit breaker open; failing fast")
+    try:
+        resp = _SESSION.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+    except Exception:
+        with _breaker_lock:
+            _breaker_failures += 1
+            if _breaker_failures >= _BREAKER_THRESHOLD:
+                _breaker_open_until = time.time() + _BREAKER_COOLDOWN
+                _breaker_failures = 0
+                logger.warning(
+                    f"FMP circuit breaker opened for {_BREAKER_COOLDOWN:.0f}s "
+                    f"after {_BREAKER_THRESHOLD} consecutive failures"
+                )
+        raise
+    with _breaker_lock:
+        _breaker_failures = 0
+    return resp
+
+
+@dataclass(slots=True)
 class EarningsSurprise:
     ticker: str
     eps_actual: float
@@ -33,7 +115,7 @@ class EarningsSurprise:
     guidance_weak: bool | None  # None if guidance data unavailable
 
 
-@dataclass
+@dataclass(slots=True)
 class EarningsCalendarEntry:
     ticker: str
     date: str
@@ -43,9 +125,9 @@ class EarningsCalendarEntry:
 
 
 def _beat_pct(actual: float, estimate: float) -> float:
-    if estimate == 0:
-        return 0.0
-    return (actual - estimate) / abs(estimate)
+    # Branchless: (estimate != 0) zeroes the result when there is no estimate,
+    # and (estimate == 0) keeps the denominator non-zero in that case.
+    return (actual - estimate) * (estimate != 0) / (abs(estimate) + (estimate == 0))
 
 
 def get_earnings_surprise(ticker: str, date: str | None = None) -> EarningsSurprise:
@@ -55,30 +137,43 @@ def get_earnings_surprise(ticker: str, date: str | None = None) -> EarningsSurpr
     date format: 'YYYY-MM-DD' (defaults to most recent report).
     Requires FMP_API_KEY environment variable.
     """
-    url = f"{BASE_STABLE}/earnings"
-    params = {"symbol": ticker.upper(), "apikey": FMP_API_KEY, "limit": 10}
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    records = resp.json()
-
-    if not records:
-        raise ValueError(f"No earnings data from FMP for {ticker}")
+    cache_key = {"symbol": ticker.upper(), "date": date or "latest"}
+    r = _CACHE.get("earnings", cache_key)
+    if r is None:
+        url = f"{BASE_STABLE}/earnings"
+        params = {"symbol": ticker.upper(), "apikey": FMP_API_KEY, "limit": 10}
+        resp = _fmp_get(url, params)
+        records = _parse_json(resp)
 
-    if date:
-        records = [r for r in records if r.get("date", "").startswith(date)]
         if not records:
-            raise ValueError(f"No FMP earnings data for {ticker} on {date}")
+            raise ValueError(f"No earnings data from FMP for {ticker}")
+
+        if date:
+            records = [r for r in records if r.get("date", "").startswith(date)]
+            if not records:
+                raise ValueError(f"No FMP earnings data for {ticker} on {date}")
+
+        r = records[0]
+        # A date-specific surprise never changes once reported; "latest" does.
+        # Pre-report records (epsActual null — FMP also lists upcoming quarters)
+        # get the short TTL so a same-day re-fetch can pick up the actuals.
+        reported = date and r.get("epsActual") is not None
+        _CACHE.set("earnings", cache_key, r,
+                   ttl=_TTL_IMMUTABLE if reported else _TTL_RECENT)
 
-    r = records[0]
+    def _num(key: str) -> float:
+        v = r.get(key)  # one lookup per field; null/missing both mean 0.0
+        return float(v) if v else 0.0
 
-    eps_actual = float(r.get("epsActual") or 0.0)
-    eps_estimate = float(r.get("epsEstimated") or 0.0)
-    rev_actual = float(r.get("revenueActual") or 0.0)
-    rev_estimate = float(r.get("revenueEstimated") or 0.0)
+    eps_actual = _num("epsActual")
+    eps_estimate = _num("epsEstimated")
+    rev_actual = _num("revenueActual")
+    rev_estimate = _num("revenueEstimated")
 
+    guidance_eps = r.get("guidanceEps")
     guidance_weak: bool | None = None
-    if "guidanceEps" in r and r["guidanceEps"] is not None:
-        guidance_weak = float(r["guidanceEps"]) < eps_estimate
+    if guidance_eps is not None:
+        guidance_weak = float(guidance_eps) < eps_estimate
 
     return EarningsSurprise(
         ticker=ticker.upper(),
@@ -92,17 +187,31 @@ def get_earnings_surprise(ticker: str, date: str | None = None) -> EarningsSurpr
     )
 
 
-def get_earnings_calendar(date: str, timing: str = "amc") -> list[str]:
-    """Return list of ticker symbols reporting on the given date.
+def _fetch_calendar(start: str, end: str) -> list[dict]:
+    """Fetch raw earnings-calendar records for [start, end], with disk caching."""
+    cache_key = {"from": start, "to": end}
+    records = _CACHE.get("earnings-calendar", cache_key)
+    if records is None:
+        url = f"{BASE_STABLE}/earnings-calendar"
+        params = {"from": start, "to": end, "apikey": FMP_API_KEY}
+        resp = _fmp_get(url, params)
+        records = _parse_json(resp)
+        # Past calendars are settled; ranges touching today may still shift.
+        today = datetime.now().strftime("%Y-%m-%d")
+        _CACHE.set("earnings-calendar", cache_key, records,
+                   ttl=_TTL_IMMUTABLE if end < today else _TTL_CALENDAR)
+    return records
 
-    date format: 'YYYY-MM-DD'.
+
+def get_earnings_calendar(start: str, end: str | None = None, timing: str = "amc") -> list[str]:
+    """Return list of ticker symbols reporting between start and end (inclusive).
+
+    The FMP endpoint accepts a date range, so callers sweeping several days
+    should pass both bounds and pay one round trip instead of one per day.
+    date format: 'YYYY-MM-DD'. end defaults to start (single-date behavior).
     timing: 'amc' (after market close, default), 'bmo' (before market open), or 'all'.
     """
-    url = f"{BASE_STABLE}/earnings-calendar"
-    params = {"from": date, "to": date, "apikey": FMP_API_KEY}
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    records = resp.json()
+    records = _fetch_calendar(start, end or start)
 
     tickers = []
     for r in records:
@@ -118,17 +227,17 @@ def get_earnings_calendar(date: str, timing: str = "amc") -> list[str]:
             if symbol:
                 tickers.append(symbol)
 
-    logger.info(f"Earnings calendar for {date} ({timing}): {len(tickers)} tickers")
+    logger.info(f"Earnings calendar for {start}..{end or start} ({timing}): {len(tickers)} tickers")
     return tickers
 
 
-def get_earnings_calendar_details(date: str) -> list[EarningsCalendarEntry]:
-    """Return earnings calendar entries with estimate data for all tickers on the given date."""
-    url = f"{BASE_STABLE}/earnings-calendar"
-    params = {"from": date, "to": date, "apikey": FMP_API_KEY}
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    records = resp.json()
+def get_earnings_calendar_details(start: str, end: str | None = None) -> list[EarningsCalendarEntry]:
+    """Return earnings calendar entries with estimate data between start and end (inclusive).
+
+    end defaults to start (single-date behavior). Each entry carries the date
+    FMP reports for it, so multi-day results stay distinguishable.
+    """
+    records = _fetch_calendar(start, end or start)
 
     entries = []
     for r in records:
@@ -146,11 +255,11 @@ def get_earnings_calendar_details(date: str) -> list[EarningsCalendarEntry]:
         rev_est = r.get("revenueEstimated")
         entries.append(EarningsCalendarEntry(
             ticker=symbol.upper(),
-            date=date,
+            date=(r.get("date") or start)[:10],
             timing=timing,
             eps_estimate=float(eps_est) if eps_est is not None else None,
             rev_estimate=float(rev_est) if rev_est is not None else None,
         ))
 
-    logger.info(f"Earnings calendar details for {date}: {len(entries)} entries")
+    logger.info(f"Earnings calendar details for {start}..{end or start}: {len(entries)} entries")
     return entries
@@ -2,7 +2,10 @@
 Price data from yfinance. All % changes are fractional (0.05 = 5%).
 
     get_ohlcv(ticker, days)          -> pd.DataFrame   columns: Open High Low Close Volume
+    get_ohlcv_batch(tickers, days)   -> dict[str, pd.DataFrame]  one yf.download for all tickers
     get_atr(ticker, period=14)       -> float          Average True Range (Wilder smoothing)
+    atr_from_ohlcv(df, period=14)    -> float          ATR from an already-fetched DataFrame
+    prior_runup_from_ohlcv(df, days) -> float          run-up from an already-fetched DataFrame
     get_ah_move(ticker, date)        -> float          after-hours % move vs regular close
     get_premarket_move(ticker, date) -> float          pre-market % move vs prior regular close
     get_prior_runup(ticker, days=10) -> float          % change over prior N trading days
@@ -11,17 +14,39 @@ Note: yfinance 1m data (used by get_ah_move / get_premarket_move) is only availa
 for the past 7 days.
 """
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, time as dtime, timedelta
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
-import pytz
 import yfinance as yf
 
 from config import LOOKBACK_DAYS
 
 logger = logging.getLogger(__name__)
 
-EASTERN = pytz.timezone("US/Eastern")
+EASTERN = ZoneInfo("America/New_York")
+
+# Session windows (Eastern, inclusive bounds on 1m bars)
+REGULAR_START, REGULAR_END = dtime(9, 30), dtime(15, 59)
+AH_START, AH_END = dtime(16, 1), dtime(20, 0)
+PREMARKET_START, PREMARKET_END = dtime(4, 0), dtime(9, 29)
+
+
+def _session_ts(day, t: dtime) -> pd.Timestamp:
+    """Eastern-tz Timestamp for a session boundary on the given date."""
+    return pd.Timestamp(datetime.combine(day, t)).tz_localize(EASTERN)
+
+
+def _session_slice(idx: pd.DatetimeIndex, day, start: dtime, end: dtime) -> tuple[int, int]:
+    """Return [lo, hi) positions bounding a session window via binary search.
+
+    The 1m index is sorted, so two searchsorted calls replace an O(N)
+    boolean mask; lo == hi means the window holds no bars.
+    """
+    lo = idx.searchsorted(_session_ts(day, start))
+    hi = idx.searchsorted(_session_ts(day, end), side="right")
+    return int(lo), int(hi)
 
 
 def get_ohlcv(ticker: str, days: int) -> pd.DataFrame:
@@ -34,23 +59,65 @@ def get_ohlcv(ticker: str, days: int) -> pd.DataFrame:
     return df
 
 
+def get_ohlcv_batch(tickers: list[str], days: int) -> dict[str, pd.DataFrame]:
+    """Return {ticker: OHLCV DataFrame} for many tickers via one yf.download call.
+
+    One batched request replaces N per-ticker history calls. Tickers with no
+    data are silently omitted from the result.
+    """
+    if not tickers:
+        return {}
+    data = yf.download(
+        tickers=" ".join(tickers),
+        period=f"{days + 10}d",
+        interval="1d",
+        auto_adjust=True,
+        group_by="ticker",
+        progress=False,
+    )
+    out: dict[str, pd.DataFrame] = {}
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            df = data[ticker]
+        else:
+            df = data
+        df = df.dropna(subset=["Close"])
+        if df.empty:
+            continue
+        out[ticker] = df[["Open", "High", "Low", "Close", "Volume"]].tail(days)
+    return out
+
+
+def atr_from_ohlcv(df: pd.DataFrame, period: int = 14) -> float:
+    """Return the most recent ATR (Wilder smoothing) computed from an OHLCV DataFrame.
+
+    Works directly on NumPy arrays: true range via element-wise max, and the
+    Wilder EWM collapsed to a single dot product — unrolling
+    atr[i] = (1-alpha)*atr[i-1] + alpha*tr[i] gives the last value as a
+    decay-weighted sum over the TR series, matching ewm(adjust=False) exactly.
+    """
+    high = df["High"].to_numpy(dtype=float)
+    low = df["Low"].to_numpy(dtype=float)
+    close = df["Close"].to_numpy(dtype=float)
+
+    hl = high - low
+    hc = np.abs(high[1:] - close[:-1])
+    lc = np.abs(low[1:] - close[:-1])
+    tr = hl.copy()
+    tr[1:] = np.fmax(hl[1:], np.fmax(hc, lc))
+
+    alpha = 1.0 / period
+    decay = np.power(1.0 - alpha, np.arange(len(tr) - 1, -1, -1))
+    weights = alpha * decay
+    weights[0] = decay[0]  # seed term: atr[0] = tr[0]
+    return float(tr @ weights)
+
+
 def get_atr(ticker: str, period: int = 14) -> float:
     """Return the most recent Average True Range value (Wilder smoothing)."""
-    df = get_ohlcv(ticker, days=period + 10)
-    high = df["High"]
-    low = df["Low"]
-    close = df["Close"]
-    prev_close = close.shift(1)
-    tr = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-    atr = tr.ewm(alpha=1 / period, adjust=False).mean()
-    return float(atr.iloc[-1])
+    return atr_from_ohlcv(get_ohlcv(ticker, days=period + 10), period=period)
 
 
 def get_ah_move(ticker: str, date: str) -> float:
@@ -74,14 +141,16 @@ def get_ah_move(ticker: str, date: str) -> float:
     else:
         df.index = df.index.tz_convert(EASTERN)
 
-    regular = df.between_time("09:30", "15:59")
-    after_hours = df.between_time("16:01", "20:00")
+    # Binary-search the session boundaries instead of masking every bar
+    day = date_dt.date()
+    reg_lo, reg_hi = _session_slice(df.index, day, REGULAR_START, REGULAR_END)
+    ah_lo, ah_hi = _session_slice(df.index, day, AH_START, AH_END)
 
-    if regular.empty or after_hours.empty:
+    if reg_lo == reg_hi or ah_lo == ah_hi:
         raise ValueError(f"Insufficient session data for {ticker} on {date}")
 
-    reg_close = float(regular["Close"].iloc[-1])
-    ah_close = float(after_hours["Close"].iloc[-1])
+    reg_close = float(df["Close"].iloc[reg_hi - 1])
+    ah_close = float(df["Close"].iloc[ah_hi - 1])
     return (ah_close / reg_close) - 1.0
 
 
@@ -107,21 +176,35 @@ def get_premarket_move(ticker: str, date: str) -> float:
     else:
         df.index = df.index.tz_convert(EASTERN)
 
-    date_naive = date_dt.date()
-    prior_regular = df[df.index.date < date_naive].between_time("09:30", "15:59")
-    if prior_regular.empty:
+    # Last bar before today's midnight identifies the prior trading day; its
+    # regular-session close is then found with two more binary searches.
+    day = date_dt.date()
+    idx = df.index
+    day_lo = int(idx.searchsorted(_session_ts(day, dtime(0, 0))))
+    if day_lo == 0:
+        raise ValueError(f"No prior regular session data for {ticker}")
+    prev_day = idx[day_lo - 1].date()
+    prev_lo, prev_hi = _session_slice(idx, prev_day, REGULAR_START, REGULAR_END)
+    if prev_lo == prev_hi:
         raise ValueError(f"No prior regular session data for {ticker}")
-    prior_close = float(prior_regular["Close"].iloc[-1])
+    prior_close = float(df["Close"].iloc[prev_hi - 1])
 
-    date_data = df[df.index.date == date_naive]
-    premarket = date_data.between_time("04:00", "09:29")
-    if premarket.empty:
+    pm_lo, pm_hi = _session_slice(idx, day, PREMARKET_START, PREMARKET_END)
+    if pm_lo == pm_hi:
         raise ValueError(f"No pre-market data for {ticker} on {date}")
-    pm_last = float(premarket["Close"].iloc[-1])
+    pm_last = float(df["Close"].iloc[pm_hi - 1])
 
     return (pm_last / prior_close) - 1.0
 
 
+def prior_runup_from_ohlcv(df: pd.DataFrame, days: int = LOOKBACK_DAYS) -> float:
+    """Return the % price change over the last N trading days of an OHLCV DataFrame."""
+    closes = df["Close"].tail(days)
+    if len(closes) < 2:
+        raise ValueError("Not enough price history for run-up")
+    return float((closes.iloc[-1] / closes.iloc[0]) - 1.0)
+
+
 def get_prior_runup(ticker: str, days: int = LOOKBACK_DAYS) -> float:
     """Return the % price change over the prior N trading days.
 
@@ -7,9 +7,13 @@ Sector ETF data via yfinance. Falls back to SPY for unknown sectors.
 """
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 
+import pandas as pd
 import yfinance as yf
 
+from data._cache import FileCache
+
 logger = logging.getLogger(__name__)
 
 SECTOR_ETF_MAP: dict[str, str] = {
@@ -28,6 +32,26 @@ SECTOR_ETF_MAP: dict[str, str] = {
 }
 FALLBACK_ETF = "SPY"
 
+# yf.Ticker().info is a full network round trip; exchange and sector are
+# static per ticker, so lookups are cached in-process and the two fields we
+# actually use are persisted to disk so restarts don't re-fetch every ticker.
+_INFO_CACHE: dict[str, dict] = {}
+_DISK_CACHE = FileCache(directory=".cache/yf")
+_TTL_INFO = 30 * 86400  # exchange/sector changes are rare (relistings, reclassifications)
+
+
+def _get_info(ticker: str) -> dict:
+    """Return {'exchange', 'sector'} for a ticker, cached in memory and on disk."""
+    info = _INFO_CACHE.get(ticker)
+    if info is None:
+        info = _DISK_CACHE.get("ticker-info", {"symbol": ticker})
+        if info is None:
+            full = yf.Ticker(ticker).info
+            info = {"exchange": full.get("exchange", ""), "sector": full.get("sector", "")}
+            _DISK_CACHE.set("ticker-info", {"symbol": ticker}, info, ttl=_TTL_INFO)
+        _INFO_CACHE[ticker] = info
+    return info
+
 
 def get_exchange(ticker: str) -> str:
     """Return the yfinance exchange code for a ticker (e.g. 'NYQ', 'NMS').
@@ -35,7 +59,7 @@ def get_exchange(ticker: str) -> str:
     Returns empty string if exchange cannot be determined.
     """
     try:
-        return yf.Ticker(ticker).info.get("exchange", "")
+        return _get_info(ticker).get("exchange", "")
     except Exception as e:
         logger.warning(f"Could not get exchange for {ticker}: {e}")
         return ""
@@ -47,7 +71,7 @@ def get_sector_etf(ticker: str) -> str:
     Falls back to 'SPY' if sector cannot be determined.
     """
     try:
-        info = yf.Ticker(ticker).info
+        info = _get_info(ticker)
         sector = info.get("sector", "")
         etf = SECTOR_ETF_MAP.get(sector, FALLBACK_ETF)
         if etf == FALLBACK_ETF and sector:
@@ -68,13 +92,22 @@ def get_sector_intraday_move(ticker: str, date: str) -> float:
     date format: 'YYYY-MM-DD'
     Returns fractional change, e.g. -0.01 = -1%.
     """
-    etf = get_sector_etf(ticker)
+    return _etf_intraday_move(get_sector_etf(ticker), date)
+
+
+@lru_cache(maxsize=64)
+def _etf_intraday_move(etf: str, date: str) -> float:
+    """Fetch and compute the intraday move for one ETF, memoized per (etf, date).
+
+    A scan evaluates many tickers but only ~12 distinct sector ETFs, so the
+    cache collapses the per-ticker fetches to one download per ETF.
+    """
     date_dt = datetime.strptime(date, "%Y-%m-%d")
     start = (date_dt - timedelta(days=5)).strftime("%Y-%m-%d")
     end = (date_dt + timedelta(days=1)).strftime("%Y-%m-%d")
 
-    import pytz
-    eastern = pytz.timezone("US/Eastern")
+    from zoneinfo import ZoneInfo
+    eastern = ZoneInfo("America/New_York")
 
     df = yf.Ticker(etf).history(start=start, end=end, interval="1m", prepost=True)
     if df.empty:
@@ -85,13 +118,17 @@ def get_sector_intraday_move(ticker: str, date: str) -> float:
     else:
         df.index = df.index.tz_convert(eastern)
 
+    from data.prices import REGULAR_START, REGULAR_END
+
     date_naive = date_dt.date()
-    prior_regular = df[df.index.date < date_naive].between_time("09:30", "15:59")
+    tod = df.index.time
+    dates = df.index.date
+    prior_regular = df[(dates < date_naive) & (tod >= REGULAR_START) & (tod <= REGULAR_END)]
     if prior_regular.empty:
         raise ValueError(f"No prior regular session data for {etf}")
     prior_close = float(prior_regular["Close"].iloc[-1])
 
-    today_data = df[df.index.date == date_naive]
+    today_data = df[dates == date_naive]
     if today_data.empty:
         raise ValueError(f"No intraday ETF data for {etf} on {date}")
     latest_price = float(today_data["Close"].iloc[-1])
@@ -99,6 +136,16 @@ def get_sector_intraday_move(ticker: str, date: str) -> float:
     return (latest_price / prior_close) - 1.0
 
 
+def reset_intraday_cache() -> None:
+    """Drop memoized intraday ETF moves.
+
+    The memo is only valid within one scan: the "latest" price moves all day,
+    so a second in-process cycle on the same date must not reuse the reading
+    taken at the previous cycle's start. Call at the top of each scan cycle.
+    """
+    _etf_intraday_move.cache_clear()
+
+
 def get_sector_move(ticker: str, date: str) -> float:
     """Return the sector ETF's daily % change on the given date.
 
@@ -116,14 +163,14 @@ def get_sector_move(ticker: str, date: str) -> float:
 
     # Strip timezone for date comparison
     df.index = df.index.tz_localize(None) if df.index.tzinfo else df.index
-    target = df[df.index.strftime("%Y-%m-%d") == date]
-    if target.empty:
+    # Vectorized datetime64 comparison — no per-row strftime formatting
+    mask = df.index.normalize() == pd.Timestamp(date)
+    if not mask.any():
         raise ValueError(f"No ETF data for {etf} on {date}")
 
-    target_idx = df.index.get_loc(target.index[0])
+    target_idx = int(mask.argmax())
     if target_idx == 0:
         raise ValueError(f"No prior day available for {etf} on {date}")
 
-    today_close = float(df["Close"].iloc[target_idx])
-    prev_close = float(df["Close"].iloc[target_idx - 1])
-    return (today_close / prev_close) - 1.0
+    # pct_change runs in pandas' C kernel; iat is the O(1) scalar accessor
+    return float(df["Close"].pct_change().iat[target_idx])
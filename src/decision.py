@@ -25,7 +25,7 @@ from data.earnings import EarningsSurprise
 from state import Position
 
 
-@dataclass
+@dataclass(slots=True)
 class EntrySignal:
     ticker: str
     should_enter: bool
@@ -34,7 +34,7 @@ class EntrySignal:
     initial_stop: float | None       # entry_price - (ATR_STOP_MULTIPLIER * ATR)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionAction:
     ticker: str
     action: Literal["hold", "sell", "update_stop"]
@@ -65,6 +65,10 @@ def evaluate_entry(
     """
     filters: dict[str, bool] = {}
 
+    # Cheapest check first; the full dict is still populated because the
+    # Slack scan detail renders every filter column per ticker.
+    filters["capacity"] = len(open_positions) < max_positions
+
     filters["eps_beat"] = surprise.eps_beat_pct >= min_eps_beat_pct
     filters["rev_beat"] = surprise.rev_beat_pct > 0
     filters["ah_move"] = ah_move >= min_ah_move_pct
@@ -77,8 +81,6 @@ def evaluate_entry(
     else:
         filters["guidance"] = not surprise.guidance_weak
 
-    filters["capacity"] = len(open_positions) < max_positions
-
     if all(filters.values()):
         initial_stop = current_price - (atr_stop_multiplier * atr)
         return EntrySignal(
@@ -8,15 +8,16 @@ Order placement and trade logging. Routes to Alpaca paper/live or local simulati
 """
 import json
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
 
 from config import POSITION_SIZE_USD, TRADES_LOG_FILE, ALPACA_API_KEY, ALPACA_SECRET_KEY, ALPACA_BASE_URL
-from notifier import notify
+from notifier import notify_bg
 from decision import EntrySignal, PositionAction
-from state import Position, add_position, remove_position, update_stop
+from state import Position, add_position, remove_position, update_stop, deferred_saves
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +36,35 @@ class OrderResult:
     error: str | None
 
 
-def _append_trade_log(result: OrderResult) -> None:
+# When set (inside _batched_trade_log), trade log entries are buffered and
+# flushed with a single file open at the end of the batch.
+_log_buffer: list[OrderResult] | None = None
+
+
+def _write_trade_logs(results: list[OrderResult]) -> None:
     _log_path.parent.mkdir(parents=True, exist_ok=True)
     with _log_path.open("a") as f:
-        f.write(json.dumps(asdict(result)) + "\n")
+        f.writelines(json.dumps(asdict(r)) + "\n" for r in results)
+
+
+def _append_trade_log(result: OrderResult) -> None:
+    if _log_buffer is not None:
+        _log_buffer.append(result)
+        return
+    _write_trade_logs([result])
+
+
+@contextmanager
+def _batched_trade_log():
+    """Buffer trade-log appends and flush them in one write when the block exits."""
+    global _log_buffer
+    _log_buffer = []
+    try:
+        yield
+    finally:
+        results, _log_buffer = _log_buffer, None
+        if results:
+            _write_trade_logs(results)
 
 
 def _place_alpaca_order(
@@ -114,49 +140,57 @@ def execute_signals(
     Places orders and updates state for each.
     current_prices is required for sell orders (to log the fill price).
     """
-    # --- BUY: process entry signals ---
-    for sig in signals:
-        if not sig.should_enter:
-            logger.debug(f"Skipping {sig.ticker}: {sig.filters_passed}")
-            continue
-
-        price = sig.entry_price
-        quantity = max(1, int(POSITION_SIZE_USD / price))
-
-        place_order(sig.ticker, "buy", quantity, fill_price=price, mode=mode)
-
-        new_pos = Position(
-            ticker=sig.ticker,
-            entry_price=price,
-            current_stop=sig.initial_stop,
-            entry_date=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-            day_count=0,
-            quantity=quantity,
-        )
-        add_position(new_pos)
-        logger.info(
-            f"Opened position: {sig.ticker} @ {price:.2f}, "
-            f"stop={sig.initial_stop:.2f}, qty={quantity}"
+    # One trade-log write and one position-store write for the whole batch,
+    # however many orders it contains.
+    with _batched_trade_log(), deferred_saves():
+        # --- BUY: process entry signals ---
+        for sig in signals:
+            if not sig.should_enter:
+                logger.debug(f"Skipping {sig.ticker}: {sig.filters_passed}")
+                continue
+
+            price = sig.entry_price
+            quantity = max(1, int(POSITION_SIZE_USD / price))
+
+            place_order(sig.ticker, "buy", quantity, fill_price=price, mode=mode)
+
+            new_pos = Position(
+                ticker=sig.ticker,
+                entry_price=price,
+                current_stop=sig.initial_stop,
+                entry_date=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+                day_count=0,
+                quantity=quantity,
+            )
+            add_position(new_pos)
+            logger.info(
+                f"Opened position: {sig.ticker} @ {price:.2f}, "
+                f"stop={sig.initial_stop:.2f}, qty={quantity}"
+            )
+            notify_bg(f"📈 *BUY {sig.ticker}* — {quantity} shares @ ${price:.2f} | stop ${sig.initial_stop:.2f}")
+
+        # --- SELL / UPDATE_STOP: process position actions ---
+        prices = current_prices or {}
+
+        # One state read for the whole batch instead of one per sell action,
+        # indexed by ticker so each sell is a dict hit rather than a list scan
+        from state import load_positions
+        pos_by_ticker = (
+            {p.ticker: p for p in load_positions()}
+            if any(a.action == "sell" for a in actions) else {}
         )
-        notify(f"📈 *BUY {sig.ticker}* — {quantity} shares @ ${price:.2f} | stop ${sig.initial_stop:.2f}")
-
-    # --- SELL / UPDATE_STOP: process position actions ---
-    prices = current_prices or {}
-
-    for act in actions:
-        if act.action == "sell":
-            fill_price = prices.get(act.ticker, 0.0)
-            # Look up quantity from state
-            from state import load_positions
-            open_positions = load_positions()
-            pos = next((p for p in open_positions if p.ticker == act.ticker), None)
-            qty = pos.quantity if pos else 0
-
-            place_order(act.ticker, "sell", qty, fill_price=fill_price, mode=mode)
-            remove_position(act.ticker)
-            logger.info(f"Closed position: {act.ticker} @ {fill_price:.2f}, reason={act.reason}")
-            notify(f"📉 *SELL {act.ticker}* — {qty} shares @ ${fill_price:.2f} | reason: {act.reason}")
-
-        elif act.action == "update_stop":
-            update_stop(act.ticker, act.new_stop)
-            logger.info(f"Updated stop for {act.ticker} to {act.new_stop:.2f}")
+
+        for act in actions:
+            if act.action == "sell":
+                fill_price = prices.get(act.ticker, 0.0)
+                pos = pos_by_ticker.get(act.ticker)
+                qty = pos.quantity if pos else 0
+
+                place_order(act.ticker, "sell", qty, fill_price=fill_price, mode=mode)
+                remove_position(act.ticker)
+                logger.info(f"Closed position: {act.ticker} @ {fill_price:.2f}, reason={act.reason}")
+                notify_bg(f"📉 *SELL {act.ticker}* — {qty} shares @ ${fill_price:.2f} | reason: {act.reason}")
+
+            elif act.action == "update_stop":
+                update_stop(act.ticker, act.new_stop)
+                logger.info(f"Updated stop for {act.ticker} to {act.new_stop:.2f}")
@@ -2,14 +2,19 @@
 Slack + Discord notifications. Silently no-ops if env vars are not set.
 
     notify(text) -> str | None   post a message, return thread_ts
+    notify_bg(text) -> None      fire-and-forget post from a background worker
     notify_thread(thread_ts, text) -> None   reply in thread
 
 Requires env vars: SLACK_BOT_TOKEN, SLACK_NOTIFY_CHANNEL
 Optional env vars: DISCORD_BOT_TOKEN, DISCORD_EARNINGS_CHANNEL
 """
+import atexit
 import json
 import os
 import logging
+import queue
+import threading
+import time
 import urllib.request
 
 logger = logging.getLogger(__name__)
@@ -72,6 +77,49 @@ def notify(text: str) -> str | None:
         return None
 
 
+# Background worker for fire-and-forget sends: each Slack/Discord post is an
+# HTTPS round trip, and per-trade notifications don't need to block order flow.
+_bg_queue: queue.Queue = queue.Queue()
+_bg_worker: threading.Thread | None = None
+_bg_lock = threading.Lock()
+
+
+def _bg_drain() -> None:
+    while True:
+        text = _bg_queue.get()
+        try:
+            notify(text)
+        except Exception as e:
+            logger.warning(f"Background notification failed: {e}")
+        finally:
+            _bg_queue.task_done()
+
+
+def _bg_flush(timeout: float = 5.0) -> None:
+    """Give queued notifications a bounded window to go out before exit.
+
+    The worker is a daemon thread, so without this a restart right after a
+    cycle would silently drop whatever BUY/SELL messages were still queued.
+    """
+    deadline = time.monotonic() + timeout
+    while _bg_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def notify_bg(text: str) -> None:
+    """Queue a message for a background daemon thread; returns immediately.
+
+    Use notify() instead when the Slack ts is needed for threading.
+    """
+    global _bg_worker
+    with _bg_lock:
+        if _bg_worker is None:
+            _bg_worker = threading.Thread(target=_bg_drain, name="notifier-bg", daemon=True)
+            _bg_worker.start()
+            atexit.register(_bg_flush)
+    _bg_queue.put(text)
+
+
 def notify_thread(thread_ts: str, text: str) -> None:
     """Reply to an existing message in a thread (Slack only)."""
     channel = os.environ.get("SLACK_NOTIFY_CHANNEL")
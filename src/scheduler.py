@@ -6,21 +6,31 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Literal
+from zoneinfo import ZoneInfo
 
-import pytz
-from apscheduler.schedulers.blocking import BlockingScheduler
-
-from config import TRADING_MODE, ALLOWED_EXCHANGES
+from config import TRADING_MODE, ALLOWED_EXCHANGES, MAX_POSITIONS
 from notifier import notify, notify_thread
 from data.earnings import get_earnings_calendar_details, get_earnings_surprise
-from data.prices import get_ohlcv, get_atr, get_prior_runup
-from data.sector import get_sector_intraday_move
+from data.prices import (
+    get_ohlcv,
+    get_ohlcv_batch,
+    atr_from_ohlcv,
+    prior_runup_from_ohlcv,
+)
+from data.sector import get_sector_intraday_move, reset_intraday_cache
 from decision import evaluate_entry, evaluate_positions
 from execution import execute_signals
 from state import load_positions, save_positions
 
 logger = logging.getLogger(__name__)
-EASTERN = pytz.timezone("US/Eastern")
+EASTERN = ZoneInfo("America/New_York")
+
+# Daily bars fetched per ticker in a scan: enough for ATR(14) warm-up and the
+# 10-day prior run-up window.
+SCAN_HISTORY_DAYS = 24
+
+# Indexed by the filter's boolean: _CHECK_ICONS[passed]
+_CHECK_ICONS = ("❌", "✅")
 
 
 def _get_spy_return_daily() -> float | None:
@@ -50,6 +60,48 @@ def _get_spy_return_period(start: datetime, end: datetime) -> float | None:
         return None
 
 
+def _scan_ticker(
+    ticker: str,
+    entry_date: str,
+    today: str,
+    open_positions: list,
+    df=None,
+) -> "EntrySignal | None":
+    """Fetch per-ticker data and evaluate the entry signal. Returns None on error.
+
+    The work is network-bound (FMP surprise + yfinance history/sector), so
+    run_scan_cycle fans these calls out over a thread pool. df is the ticker's
+    daily OHLCV from the batched download; price, ATR, and run-up all derive
+    from it locally.
+    """
+    try:
+        if df is None:
+            df = get_ohlcv(ticker, days=SCAN_HISTORY_DAYS)
+        surprise = get_earnings_surprise(ticker, date=entry_date)
+        sector_move = get_sector_intraday_move(ticker, today)
+        prior_runup = prior_runup_from_ohlcv(df)
+        atr = atr_from_ohlcv(df)
+        current_price = float(df["Close"].iloc[-1])
+        prior_close = float(df["Close"].iloc[-2]) if len(df) >= 2 else current_price
+        overnight_gap = (current_price / prior_close) - 1.0
+
+        sig = evaluate_entry(
+            ticker=ticker,
+            surprise=surprise,
+            ah_move=overnight_gap,
+            prior_runup=prior_runup,
+            sector_move=sector_move,
+            atr=atr,
+            current_price=current_price,
+            open_positions=open_positions,
+        )
+        logger.info(f"{ticker}: should_enter={sig.should_enter}, gap={overnight_gap:.1%}, filters={sig.filters_passed}")
+        return sig
+    except Exception as e:
+        logger.error(f"Error processing {ticker}: {e}", exc_info=True)
+        return None
+
+
 def run_scan_cycle(mode: str = "paper") -> None:
     """9:30 AM ET — exit/update open positions, then scan for new entries.
 
@@ -65,6 +117,9 @@ def run_scan_cycle(mode: str = "paper") -> None:
     today = eastern_now.strftime("%Y-%m-%d")
     yesterday = (eastern_now - timedelta(days=1)).strftime("%Y-%m-%d")
     logger.info(f"=== Scan Cycle: {today} ===")
+    # ETF intraday moves are memoized per (etf, date) but vary within the day;
+    # start each cycle fresh so a re-run doesn't reuse an earlier reading.
+    reset_intraday_cache()
 
     # --- Exit / update open positions ---
     positions = load_positions()
@@ -73,14 +128,17 @@ def run_scan_cycle(mode: str = "paper") -> None:
     current_atrs: dict[str, float] = {}
 
     prev_prices: dict[str, float] = {}
+    position_dfs = get_ohlcv_batch([p.ticker for p in positions], days=SCAN_HISTORY_DAYS)
     for pos in positions:
         pos.day_count += 1
         try:
-            df = get_ohlcv(pos.ticker, days=2)
+            df = position_dfs.get(pos.ticker)
+            if df is None:
+                raise ValueError(f"No OHLCV data for {pos.ticker}")
             current_prices[pos.ticker] = float(df["Close"].iloc[-1])
             if len(df) >= 2:
                 prev_prices[pos.ticker] = float(df["Close"].iloc[-2])
-            current_atrs[pos.ticker] = get_atr(pos.ticker)
+            current_atrs[pos.ticker] = atr_from_ohlcv(df)
         except Exception as e:
             logger.error(f"Error fetching data for {pos.ticker}: {e}", exc_info=True)
 
@@ -89,50 +147,54 @@ def run_scan_cycle(mode: str = "paper") -> None:
         actions = evaluate_positions(positions, current_prices, current_atrs)
         execute_signals([], actions, current_prices=current_prices, mode=mode)
 
-    # Reload after exits so entry evaluation sees accurate open position count
-    open_positions = load_positions()
+    # Positions are already in memory; drop the ones just sold rather than
+    # re-reading and re-parsing the store. Entry evaluation only needs an
+    # accurate open-position count for the capacity filter.
+    sold = {a.ticker for a in actions if a.action == "sell"}
+    open_positions = [p for p in positions if p.ticker not in sold]
 
     # --- Scan for new entries ---
-    try:
-        entries_amc = get_earnings_calendar_details(yesterday)
-        entries_bmo = get_earnings_calendar_details(today)
-        all_entries = [e for e in entries_amc + entries_bmo if e.eps_estimate is not None]
-        entry_by_ticker = {e.ticker: e for e in all_entries}
-        tickers = _filter_us_exchange([e.ticker for e in all_entries])
-    except Exception as e:
-        logger.error(f"Failed to fetch earnings calendar: {e}", exc_info=True)
+    # No capacity → every signal would fail on the capacity filter anyway,
+    # so skip the calendar fetch and the per-ticker fan-out entirely.
+    if len(open_positions) >= MAX_POSITIONS:
+        logger.info(f"Max positions ({MAX_POSITIONS}) reached; skipping entry scan")
         tickers = []
         entry_by_ticker = {}
-
-    signals = []
-    for ticker in tickers:
+    else:
         try:
-            entry_date = entry_by_ticker[ticker].date if ticker in entry_by_ticker else today
-            surprise = get_earnings_surprise(ticker, date=entry_date)
-            prior_runup = get_prior_runup(ticker)
-            sector_move = get_sector_intraday_move(ticker, today)
-            atr = get_atr(ticker)
-            df = get_ohlcv(ticker, days=2)
-            current_price = float(df["Close"].iloc[-1])
-            prior_close = float(df["Close"].iloc[-2]) if len(df) >= 2 else current_price
-            overnight_gap = (current_price / prior_close) - 1.0
-
-            sig = evaluate_entry(
-                ticker=ticker,
-                surprise=surprise,
-                ah_move=overnight_gap,
-                prior_runup=prior_runup,
-                sector_move=sector_move,
-                atr=atr,
-                current_price=current_price,
-                open_positions=open_positions,
-            )
-            signals.append(sig)
-            logger.info(f"{ticker}: should_enter={sig.should_enter}, gap={overnight_gap:.1%}, filters={sig.filters_passed}")
-
+            # One ranged call covers yesterday's AMC reports and today's BMO
+            # reports; filter and index in a single pass over the entries
+            entry_by_ticker = {
+                e.ticker: e
+                for e in get_earnings_calendar_details(yesterday, today)
+                if e.eps_estimate is not None
+            }
+            tickers = _filter_us_exchange(list(entry_by_ticker))
         except Exception as e:
-            logger.error(f"Error processing {ticker}: {e}", exc_info=True)
-            continue
+            logger.error(f"Failed to fetch earnings calendar: {e}", exc_info=True)
+            tickers = []
+            entry_by_ticker = {}
+
+    signals = []
+    if tickers:
+        scan_dfs = get_ohlcv_batch(tickers, days=SCAN_HISTORY_DAYS)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                pool.submit(
+                    _scan_ticker,
+                    ticker,
+                    entry_by_ticker[ticker].date if ticker in entry_by_ticker else today,
+                    today,
+                    open_positions,
+                    scan_dfs.get(ticker),
+                ): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                sig = future.result()
+                if sig is not None:
+                    signals.append(sig)
+        signals.sort(key=lambda s: s.ticker)
 
     if signals:
         execute_signals(signals, [], mode=mode)
@@ -212,7 +274,7 @@ def run_scan_cycle(mode: str = "paper") -> None:
         scan_lines.append("  " + " | ".join(keys))
         max_ticker_len = max(len(sig.ticker) for sig in signals)
         for sig in signals:
-            checks = " ".join("✅" if v else "❌" for v in sig.filters_passed.values())
+            checks = " ".join([_CHECK_ICONS[v] for v in sig.filters_passed.values()])
             ticker_col = sig.ticker.ljust(max_ticker_len)
             if sig.should_enter:
                 scan_lines.append(f"📈 `{ticker_col}` — BUY @ ${sig.entry_price:.2f} | stop ${sig.initial_stop:.2f}  {checks}")
@@ -222,22 +284,25 @@ def run_scan_cycle(mode: str = "paper") -> None:
 
 
 
-def run_monthly_pnl_summary() -> None:
-    """1st of each month, 9:30 AM ET — post last month's realized PnL summary to Slack."""
-    now = datetime.now(EASTERN)
-    # Last month's date range
-    first_of_this_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    last_month_end = first_of_this_month
-    last_month_start = (first_of_this_month - timedelta(days=1)).replace(day=1)
-    month_label = last_month_start.strftime("%B %Y")
-    logger.info(f"=== Monthly PnL Summary: {last_month_start.date()} to {last_month_end.date()} ===")
+def _run_pnl_summary(
+    period_start: datetime,
+    period_end: datetime,
+    title: str,
+    no_trades_line: str,
+) -> None:
+    """Post a realized-PnL summary for sells in [period_start, period_end) to Slack.
 
+    Shared by the weekly and monthly jobs, which differ only in the date range
+    and wording — keeping one body means fixes and formatting land once.
+    """
     trades_path = Path(__file__).parent.parent / "data" / "trades_log.jsonl"
     if not trades_path.exists():
-        notify(f"*Monthly PnL Summary — {month_label}*: no trades log found.")
+        notify(f"{title}: no trades log found.")
         return
 
-    buys: dict[str, list[dict]] = defaultdict(list)
+    # Load all successful trades; sells in the period close the earliest
+    # unmatched buy for their ticker.
+    buys: dict[str, list[dict]] = defaultdict(list)   # ticker → stack of buy entries
     closed_trades: list[dict] = []
 
     with trades_path.open() as f:
@@ -254,7 +319,7 @@ def run_monthly_pnl_summary() -> None:
             ts = datetime.fromisoformat(t["timestamp"]).astimezone(EASTERN)
             if t["action"] == "buy":
                 buys[t["ticker"]].append({"price": t["fill_price"], "qty": t["quantity"], "ts": ts})
-            elif t["action"] == "sell" and last_month_start <= ts < last_month_end:
+            elif t["action"] == "sell" and period_start <= ts < period_end:
                 ticker = t["ticker"]
                 buy = buys[ticker].pop(0) if buys[ticker] else None
                 closed_trades.append({
@@ -265,7 +330,7 @@ def run_monthly_pnl_summary() -> None:
                     "sell_ts": ts,
                 })
 
-    lines = [f"*Monthly PnL Summary — {month_label}*"]
+    lines = [title]
 
     if closed_trades:
         total_pnl = 0.0
@@ -299,26 +364,30 @@ def run_monthly_pnl_summary() -> None:
             portfolio_pct = total_pnl / total_invested * 100
             pnl_pct_sign = "+" if portfolio_pct >= 0 else ""
             pnl_pct_str = f" ({pnl_pct_sign}{portfolio_pct:.2f}%)"
-            spy_monthly = _get_spy_return_period(last_month_start, last_month_end)
-            if spy_monthly is not None:
-                alpha = portfolio_pct - spy_monthly
-                spy_sign = "+" if spy_monthly >= 0 else ""
+            spy_period = _get_spy_return_period(period_start, period_end)
+            if spy_period is not None:
+                alpha = portfolio_pct - spy_period
+                spy_sign = "+" if spy_period >= 0 else ""
                 alpha_sign = "+" if alpha >= 0 else ""
-                spy_str = f" | SPY: {spy_sign}{spy_monthly:.2f}% | α: {alpha_sign}{alpha:.2f}%"
+                spy_str = f" | SPY: {spy_sign}{spy_period:.2f}% | α: {alpha_sign}{alpha:.2f}%"
         lines.append(
             f"\n*Total: {total_sign}${total_pnl:.2f}{pnl_pct_str}* | "
             f"{wins}W / {losses}L ({win_rate:.0f}% win rate){spy_str}"
         )
     else:
-        lines.append("No closed trades last month.")
+        lines.append(no_trades_line)
 
-    # Open positions (unrealized)
+    # Open positions (unrealized) — one batched download instead of one
+    # round trip per position
     positions = load_positions()
     if positions:
         lines.append("\n*Open Positions (unrealized)*")
+        pos_dfs = get_ohlcv_batch([p.ticker for p in positions], days=1)
         for pos in positions:
             try:
-                df = get_ohlcv(pos.ticker, days=1)
+                df = pos_dfs.get(pos.ticker)
+                if df is None:
+                    raise ValueError(f"No OHLCV data for {pos.ticker}")
                 price = float(df["Close"].iloc[-1])
                 pnl = (price - pos.entry_price) * pos.quantity
                 pnl_pct = (price - pos.entry_price) / pos.entry_price * 100
@@ -335,116 +404,35 @@ def run_monthly_pnl_summary() -> None:
     notify("\n".join(lines))
 
 
+def run_monthly_pnl_summary() -> None:
+    """1st of each month, 9:30 AM ET — post last month's realized PnL summary to Slack."""
+    now = datetime.now(EASTERN)
+    # Last month's date range
+    first_of_this_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_month_end = first_of_this_month
+    last_month_start = (first_of_this_month - timedelta(days=1)).replace(day=1)
+    month_label = last_month_start.strftime("%B %Y")
+    logger.info(f"=== Monthly PnL Summary: {last_month_start.date()} to {last_month_end.date()} ===")
+    _run_pnl_summary(
+        last_month_start,
+        last_month_end,
+        f"*Monthly PnL Summary — {month_label}*",
+        "No closed trades last month.",
+    )
+
+
 def run_weekly_pnl_summary() -> None:
     """Monday 9:00 AM ET — post last week's realized PnL summary to Slack."""
     now = datetime.now(EASTERN)
     week_end = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = week_end - timedelta(days=7)
     logger.info(f"=== Weekly PnL Summary: {week_start.date()} to {week_end.date()} ===")
-
-    trades_path = Path(__file__).parent.parent / "data" / "trades_log.jsonl"
-    if not trades_path.exists():
-        notify("*Weekly PnL Summary*: no trades log found.")
-        return
-
-    # Load all successful trades in the past week
-    buys: dict[str, list[dict]] = defaultdict(list)   # ticker → stack of buy entries
-    closed_trades: list[dict] = []
-
-    with trades_path.open() as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                t = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if not t.get("success"):
-                continue
-            ts = datetime.fromisoformat(t["timestamp"]).astimezone(EASTERN)
-            if t["action"] == "buy":
-                buys[t["ticker"]].append({"price": t["fill_price"], "qty": t["quantity"], "ts": ts})
-            elif t["action"] == "sell" and week_start <= ts < week_end:
-                # Match against earliest unmatched buy for this ticker
-                ticker = t["ticker"]
-                buy = buys[ticker].pop(0) if buys[ticker] else None
-                closed_trades.append({
-                    "ticker": ticker,
-                    "buy_price": buy["price"] if buy else None,
-                    "sell_price": t["fill_price"],
-                    "qty": t["quantity"],
-                    "sell_ts": ts,
-                })
-
-    lines = [f"*Weekly PnL Summary — {week_start.strftime('%b %d')} to {week_end.strftime('%b %d, %Y')}*"]
-
-    if closed_trades:
-        total_pnl = 0.0
-        total_invested = 0.0
-        wins, losses = 0, 0
-        for ct in closed_trades:
-            if ct["buy_price"] is not None:
-                pnl = (ct["sell_price"] - ct["buy_price"]) * ct["qty"]
-                pnl_pct = (ct["sell_price"] - ct["buy_price"]) / ct["buy_price"] * 100
-                total_pnl += pnl
-                total_invested += ct["buy_price"] * ct["qty"]
-                sign = "+" if pnl >= 0 else ""
-                icon = "✅" if pnl >= 0 else "❌"
-                if pnl >= 0:
-                    wins += 1
-                else:
-                    losses += 1
-                lines.append(
-                    f"{icon} *{ct['ticker']}* — {ct['qty']} shares | "
-                    f"${ct['buy_price']:.2f} → ${ct['sell_price']:.2f} "
-                    f"({sign}{pnl_pct:.1f}%) | {sign}${pnl:.2f}"
-                )
-            else:
-                lines.append(f"❓ *{ct['ticker']}* — sold @ ${ct['sell_price']:.2f} (no matching buy)")
-
-        total_sign = "+" if total_pnl >= 0 else ""
-        win_rate = wins / (wins + losses) * 100 if (wins + losses) > 0 else 0
-        pnl_pct_str = ""
-        spy_str = ""
-        if total_invested > 0:
-            portfolio_pct = total_pnl / total_invested * 100
-            pnl_pct_sign = "+" if portfolio_pct >= 0 else ""
-            pnl_pct_str = f" ({pnl_pct_sign}{portfolio_pct:.2f}%)"
-            spy_weekly = _get_spy_return_period(week_start, week_end)
-            if spy_weekly is not None:
-                alpha = portfolio_pct - spy_weekly
-                spy_sign = "+" if spy_weekly >= 0 else ""
-                alpha_sign = "+" if alpha >= 0 else ""
-                spy_str = f" | SPY: {spy_sign}{spy_weekly:.2f}% | α: {alpha_sign}{alpha:.2f}%"
-        lines.append(
-            f"\n*Total: {total_sign}${total_pnl:.2f}{pnl_pct_str}* | "
-            f"{wins}W / {losses}L ({win_rate:.0f}% win rate){spy_str}"
-        )
-    else:
-        lines.append("No closed trades this week.")
-
-    # Open positions (unrealized)
-    positions = load_positions()
-    if positions:
-        lines.append("\n*Open Positions (unrealized)*")
-        for pos in positions:
-            try:
-                df = get_ohlcv(pos.ticker, days=1)
-                price = float(df["Close"].iloc[-1])
-                pnl = (price - pos.entry_price) * pos.quantity
-                pnl_pct = (price - pos.entry_price) / pos.entry_price * 100
-                sign = "+" if pnl >= 0 else ""
-                lines.append(
-                    f"  • *{pos.ticker}* — {pos.quantity} sh | "
-                    f"${pos.entry_price:.2f} → ${price:.2f} "
-                    f"({sign}{pnl_pct:.1f}%) | {sign}${pnl:.2f} | day {pos.day_count}/10"
-                )
-            except Exception as e:
-                logger.warning(f"Could not fetch price for {pos.ticker}: {e}")
-                lines.append(f"  • *{pos.ticker}* — price unavailable | day {pos.day_count}/10")
-
-    notify("\n".join(lines))
+    _run_pnl_summary(
+        week_start,
+        week_end,
+        f"*Weekly PnL Summary — {week_start.strftime('%b %d')} to {week_end.strftime('%b %d, %Y')}*",
+        "No closed trades this week.",
+    )
 
 
 _US_TICKER_RE = re.compile(r"^[A-Z]{1,5}$")
@@ -465,10 +453,11 @@ def _filter_us_exchange(tickers: list[str]) -> list[str]:
         import time
         time.sleep(0.3)
         try:
-            info = yf.Ticker(ticker).info
-            exchange = info.get("exchange", "")
-            quote_type = info.get("quoteType", "")
-            if exchange in ALLOWED_EXCHANGES and quote_type == "EQUITY":
+            # fast_info hits a lightweight quote endpoint instead of scraping
+            # the full quote-summary page that .info does; exchange and
+            # quote_type are both available there.
+            fi = yf.Ticker(ticker).fast_info
+            if fi.exchange in ALLOWED_EXCHANGES and fi.quote_type == "EQUITY":
                 return ticker
         except Exception as e:
             logger.warning(f"Could not get info for {ticker}: {e}")
@@ -487,6 +476,10 @@ def _filter_us_exchange(tickers: list[str]) -> list[str]:
 
 def start(mode: Literal["paper", "live"] = "paper") -> None:
     """Start the APScheduler blocking event loop. Registers both daily cycles."""
+    # Deferred: only start() needs APScheduler, so importing scheduler (e.g.
+    # to run one cycle manually or in tests) doesn't pay for it.
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -503,6 +496,8 @@ def start(mode: Literal["paper", "live"] = "paper") -> None:
         id="scan_cycle",
         name="Earnings Scan @ 9:30 AM ET",
         misfire_grace_time=60,
+        coalesce=True,
+        max_instances=1,
     )
     scheduler.add_job(
         run_weekly_pnl_summary,
@@ -513,6 +508,8 @@ def start(mode: Literal["paper", "live"] = "paper") -> None:
         id="weekly_pnl_summary",
         name="Weekly PnL Summary @ 9:30 AM ET Sunday",
         misfire_grace_time=300,
+        coalesce=True,
+        max_instances=1,
     )
     scheduler.add_job(
         run_monthly_pnl_summary,
@@ -523,6 +520,8 @@ def start(mode: Literal["paper", "live"] = "paper") -> None:
         id="monthly_pnl_summary",
         name="Monthly PnL Summary @ 9:30 AM ET on 1st",
         misfire_grace_time=3600,
+        coalesce=True,
+        max_instances=1,
     )
 
     logger.info(f"Scheduler starting in {mode!r} mode.")
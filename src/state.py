@@ -8,20 +8,30 @@ JSON-backed position store. Reads/writes data/positions.json.
     add_position(position)          -> None   no-op if ticker already exists
     remove_position(ticker)         -> None
     update_stop(ticker, new_stop)   -> None
+    deferred_saves()                context manager: batch mutations into one write
 """
 import json
 import logging
-from dataclasses import dataclass, asdict, field
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 from config import POSITIONS_FILE
 
 logger = logging.getLogger(__name__)
 
+# Optional accelerator, same pattern as data/earnings.py: orjson encodes and
+# decodes the store in C. Not a hard dependency.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 _path = Path(POSITIONS_FILE)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     ticker: str
     entry_price: float
@@ -35,21 +45,84 @@ def _ensure_data_dir() -> None:
     _path.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Parsed-JSON cache keyed by (path, mtime): skips the decode when the file is
+# unchanged between calls. Only the raw dicts are cached — Position objects are
+# rebuilt per call because callers mutate them in place (day_count, stops).
+_load_cache: tuple[Path, int, list[dict]] | None = None
+
+# Inside deferred_saves(), writes land here instead of on disk and loads are
+# served from it, so a batch of mutations costs one file write at block exit.
+_pending: list[Position] | None = None
+_defer_active = False
+
+
+@contextmanager
+def deferred_saves():
+    """Batch position mutations into a single file write.
+
+    Inside the block, save_positions buffers its argument and load_positions
+    returns the buffered (shared, mutable) list, so consecutive mutation
+    helpers see each other's changes without touching disk. The final state is
+    written once on exit. Not reentrant.
+    """
+    global _defer_active, _pending
+    _defer_active = True
+    try:
+        yield
+    finally:
+        _defer_active = False
+        pending, _pending = _pending, None
+        if pending is not None:
+            save_positions(pending)
+
+
 def load_positions() -> list[Position]:
     """Load all open positions from the JSON store."""
+    global _load_cache
+    if _pending is not None:
+        return _pending
     _ensure_data_dir()
     if not _path.exists():
         return []
-    with _path.open("r") as f:
-        raw = json.load(f)
+    mtime = _path.stat().st_mtime_ns
+    if _load_cache is not None and _load_cache[:2] == (_path, mtime):
+        raw = _load_cache[2]
+    else:
+        data = _path.read_bytes()
+        raw = _orjson.loads(data) if _orjson is not None else json.loads(data)
+        _load_cache = (_path, mtime, raw)
     return [Position(**r) for r in raw]
 
 
 def save_positions(positions: list[Position]) -> None:
     """Overwrite the JSON store with the given list of positions."""
+    global _load_cache, _pending
+    if _defer_active:
+        _pending = positions
+        return
     _ensure_data_dir()
-    with _path.open("w") as f:
-        json.dump([asdict(p) for p in positions], f, indent=2)
+    # Flat six-field records: a dict literal beats asdict's recursive copy
+    raw = [
+        {
+            "ticker": p.ticker,
+            "entry_price": p.entry_price,
+            "current_stop": p.current_stop,
+            "entry_date": p.entry_date,
+            "day_count": p.day_count,
+            "quantity": p.quantity,
+        }
+        for p in positions
+    ]
+    # Write-then-rename so a crash mid-write can never leave a truncated
+    # store behind; readers see either the old file or the new one.
+    tmp = _path.with_suffix(".json.tmp")
+    if _orjson is not None:
+        tmp.write_bytes(_orjson.dumps(raw, option=_orjson.OPT_INDENT_2))
+    else:
+        with tmp.open("w") as f:
+            json.dump(raw, f, indent=2)
+    os.replace(tmp, _path)
+    _load_cache = (_path, _path.stat().st_mtime_ns, raw)
 
 
 def add_position(position: Position) -> None:
@@ -65,14 +138,19 @@ def add_position(position: Position) -> None:
 def remove_position(ticker: str) -> None:
     """Remove the position for the given ticker from the store."""
     positions = load_positions()
-    positions = [p for p in positions if p.ticker != ticker]
-    save_positions(positions)
+    remaining = [p for p in positions if p.ticker != ticker]
+    if len(remaining) == len(positions):
+        logger.warning(f"No position for {ticker}, nothing removed")
+        return
+    save_positions(remaining)
 
 
 def update_stop(ticker: str, new_stop: float) -> None:
     """Update the trailing stop for an existing position."""
     positions = load_positions()
-    for p in positions:
-        if p.ticker == ticker:
-            p.current_stop = new_stop
+    pos = next((p for p in positions if p.ticker == ticker), None)
+    if pos is None:
+        logger.warning(f"No position for {ticker}, stop not updated")
+        return
+    pos.current_stop = new_stop
     save_positions(positions)
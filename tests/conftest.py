@@ -1,5 +1,23 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Allow imports from src/ without PYTHONPATH
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_fmp_cache(tmp_path, monkeypatch):
+    """Point the FMP disk cache at a per-test directory so tests never share entries."""
+    from data import earnings
+    monkeypatch.setattr(earnings._CACHE, "directory", tmp_path / "fmp_cache")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_info_cache(tmp_path, monkeypatch):
+    """Clear the per-process and on-disk yfinance info caches between tests."""
+    from data import sector
+    monkeypatch.setattr(sector, "_INFO_CACHE", {})
+    monkeypatch.setattr(sector._DISK_CACHE, "directory", tmp_path / "yf_cache")
+    sector.reset_intraday_cache()
@@ -1,6 +1,9 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from data.earnings import get_earnings_surprise, get_earnings_calendar
+from data import earnings
+from data.earnings import (
+    get_earnings_surprise, get_earnings_calendar, get_earnings_calendar_details,
+)
 
 
 SAMPLE_RECORD = {
@@ -24,7 +27,7 @@ def _mock_response(records):
 # --- get_earnings_surprise ---
 
 def test_get_earnings_surprise_parses_fields():
-    with patch("data.earnings.requests.get", return_value=_mock_response([SAMPLE_RECORD])):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([SAMPLE_RECORD])):
         s = get_earnings_surprise("AAPL")
     assert s.ticker == "AAPL"
     assert s.eps_beat_pct == pytest.approx((1.50 - 1.20) / 1.20)
@@ -33,20 +36,37 @@ def test_get_earnings_surprise_parses_fields():
 
 
 def test_get_earnings_surprise_no_records_raises():
-    with patch("data.earnings.requests.get", return_value=_mock_response([])):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([])):
         with pytest.raises(ValueError, match="No earnings data"):
             get_earnings_surprise("AAPL")
 
 
 def test_get_earnings_surprise_date_mismatch_raises():
-    with patch("data.earnings.requests.get", return_value=_mock_response([SAMPLE_RECORD])):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([SAMPLE_RECORD])):
         with pytest.raises(ValueError, match="No FMP earnings data"):
             get_earnings_surprise("AAPL", date="2025-01-01")
 
 
+def test_get_earnings_surprise_unreported_record_gets_short_ttl():
+    # FMP lists upcoming quarters with epsActual null; those must not be
+    # frozen with the long TTL or a same-day re-fetch can never see actuals.
+    record = {**SAMPLE_RECORD, "epsActual": None}
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([record])), \
+         patch("data.earnings._CACHE.set") as mock_set:
+        get_earnings_surprise("AAPL", date="2026-01-15")
+    assert mock_set.call_args.kwargs["ttl"] == earnings._TTL_RECENT
+
+
+def test_get_earnings_surprise_reported_record_gets_long_ttl():
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([SAMPLE_RECORD])), \
+         patch("data.earnings._CACHE.set") as mock_set:
+        get_earnings_surprise("AAPL", date="2026-01-15")
+    assert mock_set.call_args.kwargs["ttl"] == earnings._TTL_IMMUTABLE
+
+
 def test_get_earnings_surprise_guidance_weak():
     record = {**SAMPLE_RECORD, "guidanceEps": 1.00}  # below eps_estimate of 1.20 → weak
-    with patch("data.earnings.requests.get", return_value=_mock_response([record])):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([record])):
         s = get_earnings_surprise("AAPL")
     assert s.guidance_weak is True
 
@@ -61,7 +81,7 @@ CALENDAR_RECORDS = [
 
 
 def test_get_earnings_calendar_amc_default():
-    with patch("data.earnings.requests.get", return_value=_mock_response(CALENDAR_RECORDS)):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response(CALENDAR_RECORDS)):
         tickers = get_earnings_calendar("2026-01-15")
     assert "AAPL" in tickers
     assert "GOOG" in tickers
@@ -69,11 +89,20 @@ def test_get_earnings_calendar_amc_default():
 
 
 def test_get_earnings_calendar_bmo():
-    with patch("data.earnings.requests.get", return_value=_mock_response(CALENDAR_RECORDS)):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response(CALENDAR_RECORDS)):
         tickers = get_earnings_calendar("2026-01-15", timing="bmo")
     assert tickers == ["MSFT"]
 
 
 def test_get_earnings_calendar_empty():
-    with patch("data.earnings.requests.get", return_value=_mock_response([])):
+    with patch("data.earnings._SESSION.get", return_value=_mock_response([])):
         assert get_earnings_calendar("2026-01-15") == []
+
+
+# --- get_earnings_calendar_details ---
+
+def test_get_earnings_calendar_details_null_date_falls_back_to_start():
+    records = [{"symbol": "AAPL", "time": "amc", "date": None}]
+    with patch("data.earnings._SESSION.get", return_value=_mock_response(records)):
+        entries = get_earnings_calendar_details("2026-01-15")
+    assert entries[0].date == "2026-01-15"
@@ -46,7 +46,7 @@ def test_execute_signals_buy_places_order_and_adds_position():
     sig = _entry_signal(entry_price=100.0)  # qty = max(1, int(1000/100)) = 10
     with patch("execution.place_order") as mock_order, \
          patch("execution.add_position") as mock_add, \
-         patch("execution.notify"):
+         patch("execution.notify_bg"):
         execute_signals([sig], [], mode="paper")
     mock_order.assert_called_once_with("AAPL", "buy", 10, fill_price=100.0, mode="paper")
     mock_add.assert_called_once()
@@ -56,7 +56,7 @@ def test_execute_signals_buy_sends_notification():
     sig = _entry_signal()
     with patch("execution.place_order"), \
          patch("execution.add_position"), \
-         patch("execution.notify") as mock_notify:
+         patch("execution.notify_bg") as mock_notify:
         execute_signals([sig], [], mode="paper")
     mock_notify.assert_called_once()
     assert "AAPL" in mock_notify.call_args[0][0]
@@ -73,7 +73,7 @@ def test_execute_signals_sell_places_order_and_removes_position():
     act = PositionAction(ticker="AAPL", action="sell", new_stop=None, reason="stop_hit")
     with patch("execution.place_order") as mock_order, \
          patch("execution.remove_position") as mock_remove, \
-         patch("execution.notify"), \
+         patch("execution.notify_bg"), \
          patch("state.load_positions", return_value=[_position()]):
         execute_signals([], [act], current_prices={"AAPL": 110.0}, mode="paper")
     mock_order.assert_called_once_with("AAPL", "sell", 10, fill_price=110.0, mode="paper")
@@ -84,7 +84,7 @@ def test_execute_signals_sell_sends_notification():
     act = PositionAction(ticker="AAPL", action="sell", new_stop=None, reason="max_days_reached")
     with patch("execution.place_order"), \
          patch("execution.remove_position"), \
-         patch("execution.notify") as mock_notify, \
+         patch("execution.notify_bg") as mock_notify, \
          patch("state.load_positions", return_value=[_position()]):
         execute_signals([], [act], current_prices={"AAPL": 110.0}, mode="paper")
     mock_notify.assert_called_once()
@@ -94,6 +94,6 @@ def test_execute_signals_sell_sends_notification():
 def test_execute_signals_update_stop():
     act = PositionAction(ticker="AAPL", action="update_stop", new_stop=98.0, reason="trailing_stop_updated")
     with patch("execution.update_stop") as mock_update, \
-         patch("execution.notify"):
+         patch("execution.notify_bg"):
         execute_signals([], [act], current_prices={"AAPL": 110.0}, mode="paper")
     mock_update.assert_called_once_with("AAPL", 98.0)
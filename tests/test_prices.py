@@ -1,10 +1,11 @@
 import pytest
 import pandas as pd
-import pytz
-from unittest.mock import patch, MagicMock
-from data.prices import get_ohlcv, get_atr, get_ah_move, get_premarket_move, get_prior_runup
+from unittest.mock import patch
+from data.prices import (
+    get_ohlcv, get_ohlcv_batch, get_atr, get_ah_move, get_premarket_move, get_prior_runup,
+)
 
-EASTERN = pytz.timezone("US/Eastern")
+EASTERN = "America/New_York"
 
 
 def _daily_df(closes):
@@ -20,7 +21,7 @@ def _daily_df(closes):
 
 def _intraday_df(entries):
     """1-minute DataFrame with Eastern-timezone index. entries: [(datetime_str, close), ...]"""
-    idx = pd.DatetimeIndex([EASTERN.localize(pd.Timestamp(t)) for t, _ in entries])
+    idx = pd.DatetimeIndex([pd.Timestamp(t, tz=EASTERN) for t, _ in entries])
     closes = [c for _, c in entries]
     return pd.DataFrame({
         "Open": closes, "High": closes, "Low": closes, "Close": closes,
@@ -28,14 +29,21 @@ def _intraday_df(entries):
     }, index=idx)
 
 
-def _mock_ticker(daily=None, intraday=None):
-    tk = MagicMock()
-    def history(**kwargs):
+class _FakeTicker:
+    """Plain stand-in for yf.Ticker — avoids MagicMock attribute machinery."""
+
+    def __init__(self, daily=None, intraday=None):
+        self._daily = daily
+        self._intraday = intraday
+
+    def history(self, **kwargs):
         if kwargs.get("interval") == "1m":
-            return intraday if intraday is not None else pd.DataFrame()
-        return daily if daily is not None else pd.DataFrame()
-    tk.history.side_effect = history
-    return tk
+            return self._intraday if self._intraday is not None else pd.DataFrame()
+        return self._daily if self._daily is not None else pd.DataFrame()
+
+
+def _mock_ticker(daily=None, intraday=None):
+    return _FakeTicker(daily=daily, intraday=intraday)
 
 
 # --- get_ohlcv ---
@@ -54,6 +62,24 @@ def test_get_ohlcv_empty_raises():
             get_ohlcv("AAPL", days=1)
 
 
+# --- get_ohlcv_batch ---
+
+def test_get_ohlcv_batch_splits_multiindex_by_ticker():
+    aapl = _daily_df([100.0, 101.0, 102.0])
+    msft = _daily_df([200.0, 202.0, 204.0])
+    combined = pd.concat({"AAPL": aapl, "MSFT": msft}, axis=1)
+    with patch("data.prices.yf.download", return_value=combined):
+        result = get_ohlcv_batch(["AAPL", "MSFT"], days=3)
+    assert set(result) == {"AAPL", "MSFT"}
+    assert result["MSFT"]["Close"].iloc[-1] == 204.0
+
+
+def test_get_ohlcv_batch_empty_tickers_skips_download():
+    with patch("data.prices.yf.download") as mock_dl:
+        assert get_ohlcv_batch([], days=3) == {}
+    mock_dl.assert_not_called()
+
+
 # --- get_atr ---
 
 def test_get_atr_returns_positive_float():
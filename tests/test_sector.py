@@ -1,14 +1,22 @@
 import pytest
 import pandas as pd
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from data.sector import get_exchange, get_sector_etf, get_sector_move
 
 
+class _FakeTicker:
+    """Plain stand-in for yf.Ticker — avoids MagicMock attribute machinery."""
+
+    def __init__(self, info=None, history_df=None):
+        self.info = info or {}
+        self._history_df = history_df
+
+    def history(self, **kwargs):
+        return self._history_df if self._history_df is not None else pd.DataFrame()
+
+
 def _mock_ticker(info=None, history_df=None):
-    tk = MagicMock()
-    tk.info = info or {}
-    tk.history.return_value = history_df if history_df is not None else pd.DataFrame()
-    return tk
+    return _FakeTicker(info=info, history_df=history_df)
 
 
 # --- get_exchange ---
@@ -1,6 +1,14 @@
 import pytest
 import state as _state_module
-from state import Position, load_positions, save_positions, add_position, remove_position, update_stop
+from state import (
+    Position,
+    load_positions,
+    save_positions,
+    add_position,
+    remove_position,
+    update_stop,
+    deferred_saves,
+)
 
 
 def _pos(ticker="AAPL", entry_price=100.0, current_stop=95.0, day_count=0):
@@ -50,9 +58,53 @@ def test_update_stop():
     assert load_positions()[0].current_stop == 98.0
 
 
+def test_load_returns_fresh_objects_from_cache():
+    save_positions([_pos("AAPL", day_count=0)])
+    first = load_positions()
+    first[0].day_count = 5
+    # Cached raw data must not be affected by mutations to returned objects
+    assert load_positions()[0].day_count == 0
+
+
+def test_load_picks_up_external_file_change():
+    save_positions([_pos("AAPL")])
+    load_positions()
+    _state_module._path.write_text("[]")
+    assert load_positions() == []
+
+
 def test_update_stop_does_not_affect_other_positions():
     save_positions([_pos("AAPL", current_stop=95.0), _pos("MSFT", current_stop=190.0)])
     update_stop("AAPL", 98.0)
     positions = {p.ticker: p for p in load_positions()}
     assert positions["AAPL"].current_stop == 98.0
     assert positions["MSFT"].current_stop == 190.0
+
+
+def test_deferred_saves_applies_all_mutations():
+    save_positions([_pos("AAPL"), _pos("MSFT")])
+    with deferred_saves():
+        add_position(_pos("NVDA"))
+        remove_position("AAPL")
+        update_stop("MSFT", 199.0)
+    positions = {p.ticker: p for p in load_positions()}
+    assert set(positions) == {"MSFT", "NVDA"}
+    assert positions["MSFT"].current_stop == 199.0
+
+
+def test_deferred_saves_writes_file_once(monkeypatch):
+    save_positions([_pos("AAPL")])
+    replaces = []
+    real_replace = _state_module.os.replace
+
+    def counting_replace(src, dst):
+        replaces.append(dst)
+        real_replace(src, dst)
+
+    # Every physical write ends in one os.replace, regardless of JSON backend
+    monkeypatch.setattr(_state_module.os, "replace", counting_replace)
+    with deferred_saves():
+        add_position(_pos("MSFT"))
+        add_position(_pos("NVDA"))
+    assert len(replaces) == 1
+    assert len(load_positions()) == 3